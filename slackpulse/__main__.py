@@ -5,11 +5,6 @@ import sys
 from pathlib import Path
 
 from .config import load_config, get_default_config_toml
-from .core.monitor import NotificationMonitor
-from .utils.logging import setup_logging
-from .utils.signals import install_signal_handlers
-from .tts.speaker import Speaker
-from .sms.sender import TwilioSender
 
 
 def main() -> int:
@@ -73,7 +68,11 @@ def main() -> int:
     args = parser.parse_args()
 
     # Handle special modes
+    # Heavy modules (detectors, TTS, Twilio) are imported only by the
+    # branches that need them so --help and friends start instantly.
     if args.list_voices:
+        from .tts.speaker import Speaker
+
         voices = Speaker.list_voices()
         print("Available voices:")
         for voice in voices:
@@ -93,6 +92,9 @@ def main() -> int:
             print("SMS/WhatsApp is not enabled. Add [sms] section to config file.")
             print(f"Config path: {args.config}")
             return 1
+
+        from .sms.sender import TwilioSender
+
         sender = TwilioSender(
             account_sid=config.sms.account_sid,
             auth_token=config.sms.auth_token,
@@ -109,6 +111,10 @@ def main() -> int:
             print(f"Failed to send test {msg_type}. Check your credentials.")
             return 1
 
+    from .core.monitor import NotificationMonitor
+    from .utils.logging import setup_logging
+    from .utils.signals import install_signal_handlers
+
     # Setup logging
     setup_logging(
         verbose=args.verbose or args.discover,
@@ -119,24 +125,18 @@ def main() -> int:
     shutdown_event = install_signal_handlers()
 
     # Create and run monitor
-    monitor = NotificationMonitor(
-        shutdown_event=shutdown_event,
-        discovery_mode=args.discover,
-        dry_run=args.dry_run,
-        use_filesystem_fallback=config.monitor.use_filesystem_fallback,
-        use_database=args.database,
-        tts_voice=config.tts.voice,
-        tts_rate=config.tts.rate,
-        tts_enabled=config.tts.enabled,
-        tts_use_openai=config.tts.use_openai,
-        dedup_window=config.filters.dedup_window_seconds,
-        sms_enabled=config.sms.enabled,
-        sms_account_sid=config.sms.account_sid,
-        sms_auth_token=config.sms.auth_token,
-        sms_from_number=config.sms.from_number,
-        sms_to_number=config.sms.to_number,
-        sms_use_whatsapp=config.sms.use_whatsapp,
-    )
+    try:
+        monitor = NotificationMonitor(
+            config,
+            shutdown_event,
+            discovery_mode=args.discover,
+            dry_run=args.dry_run,
+            use_database=args.database,
+        )
+    except ValueError as e:
+        # e.g. an invalid [filters] bot pattern
+        print(f"Invalid configuration: {e}", file=sys.stderr)
+        return 1
 
     try:
         monitor.run()
@@ -3,18 +3,12 @@
 import sys
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, Tuple
 
-if sys.version_info >= (3, 11):
-    import tomllib
-else:
-    try:
-        import tomli as tomllib
-    except ImportError:
-        tomllib = None
+from .utils.compat import DATACLASS_SLOTS
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class TTSConfig:
     """TTS configuration."""
 
@@ -24,40 +18,34 @@ class TTSConfig:
     use_openai: bool = True  # Use OpenAI TTS for natural speech
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class FilterConfig:
     """Filter configuration."""
 
-    # Bot detection patterns (regex, case-insensitive)
-    bot_patterns: List[str] = field(
-        default_factory=lambda: [
-            r"\bbot\b",
-            r"slackbot",
-            r"workflow",
-            r"automation",
-        ]
-    )
-
-    # Bot message keywords (substring match)
-    bot_keywords: List[str] = field(
-        default_factory=lambda: [
-            "has joined the channel",
-            "has left the channel",
-            "set the channel topic",
-        ]
-    )
+    # Bot detection patterns (regex, case-insensitive); None uses BotFilter defaults
+    bot_patterns: Optional[Tuple[str, ...]] = None
+
+    # Bot message keywords (substring match); None uses BotFilter defaults
+    bot_keywords: Optional[Tuple[str, ...]] = None
 
     dedup_window_seconds: int = 30
 
+    def __post_init__(self) -> None:
+        # TOML arrays load as lists; freeze them once at load time
+        if self.bot_patterns is not None:
+            object.__setattr__(self, "bot_patterns", tuple(self.bot_patterns))
+        if self.bot_keywords is not None:
+            object.__setattr__(self, "bot_keywords", tuple(self.bot_keywords))
+
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class MonitorConfig:
     """Monitor configuration."""
 
     use_filesystem_fallback: bool = True
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class SMSConfig:
     """SMS/WhatsApp configuration for Twilio."""
 
@@ -69,7 +57,7 @@ class SMSConfig:
     use_whatsapp: bool = False  # Use WhatsApp instead of SMS (no A2P registration needed)
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Config:
     """Main configuration."""
 
@@ -100,13 +88,23 @@ def load_config(path: Path) -> Config:
 
     Returns:
         Config object (defaults if file doesn't exist).
+
+    Raises:
+        RuntimeError: If the file exists but no TOML parser is available.
     """
     if not path.exists():
         return Config()
 
-    if tomllib is None:
-        # Can't parse TOML without tomllib/tomli
-        return Config()
+    # Imported here so CLI paths that never read a config don't pay for it
+    if sys.version_info >= (3, 11):
+        import tomllib
+    else:
+        try:
+            import tomli as tomllib
+        except ImportError as e:
+            raise RuntimeError(
+                f"Cannot read {path}: Python < 3.11 needs tomli. Run: pip install tomli"
+            ) from e
 
     with open(path, "rb") as f:
         data = tomllib.load(f)
@@ -124,15 +122,32 @@ rate = 200            # Words per minute (150-250 recommended)
 enabled = true
 
 [filters]
-# Patterns to identify bot senders (regex, case-insensitive)
-bot_patterns = ["\\\\bbot\\\\b", "slackbot", "workflow", "automation"]
-
-# Message content that indicates automated messages
-bot_keywords = [
-    "has joined the channel",
-    "has left the channel",
-    "set the channel topic",
-]
+# Patterns to identify bot senders (regex, case-insensitive).
+# Leave commented out to use the built-in list shown here; setting it
+# replaces that list entirely.
+# bot_patterns = [
+#     "\\\\bbot\\\\b",
+#     "slackbot",
+#     "workflow",
+#     "automation",
+#     "\\\\bapp\\\\b",
+#     "integration",
+#     "webhook",
+# ]
+
+# Message content that indicates automated messages (same rules as above)
+# bot_keywords = [
+#     "has joined the channel",
+#     "has left the channel",
+#     "set the channel topic",
+#     "set the channel description",
+#     "set the channel purpose",
+#     "was added to",
+#     "was removed from",
+#     "archived the channel",
+#     "unarchived the channel",
+#     "renamed the channel",
+# ]
 
 dedup_window_seconds = 30
 
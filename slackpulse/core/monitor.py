@@ -5,10 +5,11 @@ from datetime import datetime
 from threading import Event
 from typing import Optional, List, Dict, Any
 
+from ..config import Config
 from ..detectors.base import BaseDetector
 from ..detectors.distributed import DistributedNotificationDetector
 from ..detectors.filesystem import FileSystemDetector
-from ..detectors.database import NotificationDatabaseDetector
+from ..detectors.database import MAC_EPOCH_OFFSET, NotificationDatabaseDetector
 from ..detectors.hybrid import HybridDetector
 from ..filters.bot import BotFilter
 from ..filters.deduplication import DeduplicationCache
@@ -19,6 +20,10 @@ from .notification import SlackNotification
 logger = logging.getLogger(__name__)
 
 
+def _skip_announcement(sender: str, message: str) -> None:
+    """Stand-in for a disabled TTS/SMS channel."""
+
+
 class NotificationMonitor:
     """
     Main monitoring orchestrator.
@@ -28,67 +33,64 @@ class NotificationMonitor:
 
     def __init__(
         self,
+        config: Config,
         shutdown_event: Event,
         discovery_mode: bool = False,
         dry_run: bool = False,
-        use_filesystem_fallback: bool = True,
         use_database: bool = False,
-        tts_voice: str = "nova",
-        tts_rate: int = 150,
-        tts_enabled: bool = True,
-        tts_use_openai: bool = True,
-        dedup_window: int = 30,
-        sms_enabled: bool = False,
-        sms_account_sid: str = "",
-        sms_auth_token: str = "",
-        sms_from_number: str = "",
-        sms_to_number: str = "",
-        sms_use_whatsapp: bool = False,
     ):
         """
         Initialize the notification monitor.
 
         Args:
+            config: Loaded SlackPulse configuration.
             shutdown_event: Event to signal shutdown.
             discovery_mode: If True, log all notifications for discovery.
             dry_run: If True, print instead of TTS.
-            use_filesystem_fallback: Use filesystem detector as fallback.
             use_database: Use notification database (requires Full Disk Access).
-            tts_voice: Voice for TTS (OpenAI: nova, alloy, echo, fable, onyx, shimmer).
-            tts_rate: Speech rate in WPM (macOS fallback only).
-            tts_enabled: Whether to enable TTS.
-            tts_use_openai: Use OpenAI TTS for natural speech.
-            dedup_window: Deduplication window in seconds.
-            sms_enabled: Whether to enable SMS/WhatsApp notifications.
-            sms_account_sid: Twilio Account SID.
-            sms_auth_token: Twilio Auth Token.
-            sms_from_number: Twilio phone number.
-            sms_to_number: Destination phone number.
-            sms_use_whatsapp: Use WhatsApp instead of SMS.
         """
         self.shutdown_event = shutdown_event
         self.discovery_mode = discovery_mode
         self.dry_run = dry_run
-        self.use_filesystem_fallback = use_filesystem_fallback
         self.use_database = True  # Always use database mode for actual message content
 
+        tts = config.tts
+        sms = config.sms
+
         # Components
         self._detectors: List[BaseDetector] = []
-        self._bot_filter = BotFilter()
-        self._dedup_cache = DeduplicationCache(window_seconds=dedup_window)
+        self._bot_filter = BotFilter(
+            bot_patterns=config.filters.bot_patterns,
+            bot_keywords=config.filters.bot_keywords,
+        )
+        self._dedup_cache = DeduplicationCache(
+            window_seconds=config.filters.dedup_window_seconds
+        )
         self._speaker = Speaker(
-            voice=tts_voice,
-            rate=tts_rate,
-            enabled=tts_enabled and not dry_run,
-            use_openai=tts_use_openai,
+            voice=tts.voice,
+            rate=tts.rate,
+            enabled=tts.enabled and not dry_run,
+            use_openai=tts.use_openai,
         )
         self._sms_sender = TwilioSender(
-            account_sid=sms_account_sid,
-            auth_token=sms_auth_token,
-            from_number=sms_from_number,
-            to_number=sms_to_number,
-            enabled=sms_enabled and not dry_run,
-            use_whatsapp=sms_use_whatsapp,
+            account_sid=sms.account_sid,
+            auth_token=sms.auth_token,
+            from_number=sms.from_number,
+            to_number=sms.to_number,
+            enabled=sms.enabled and not dry_run,
+            use_whatsapp=sms.use_whatsapp,
+        )
+
+        # Bind announcement channels once; disabled ones become no-ops
+        self._speak = (
+            self._speaker.speak_notification
+            if self._speaker.enabled
+            else _skip_announcement
+        )
+        self._send_sms = (
+            self._sms_sender.send_notification
+            if self._sms_sender.enabled
+            else _skip_announcement
         )
 
         # Stats
@@ -126,12 +128,23 @@ class NotificationMonitor:
             self._notifications_filtered += 1
             return
 
+        # Prefer the delivery time reported by the detector (Mac absolute time)
+        source = "unknown"
+        delivered = None
+        if metadata:
+            source = metadata.get("source", "unknown")
+            delivered = metadata.get("delivered_date")
+
         # Create notification object
         notification = SlackNotification(
             sender=sender,
             message=message,
-            timestamp=datetime.now(),
-            source=metadata.get("source", "unknown") if metadata else "unknown",
+            timestamp=(
+                datetime.fromtimestamp(delivered + MAC_EPOCH_OFFSET)
+                if delivered is not None
+                else datetime.now()
+            ),
+            source=source,
             metadata=metadata,
         )
 
@@ -150,15 +163,9 @@ class NotificationMonitor:
         else:
             logger.info(log_msg)
             # TTS announcement
-            self._speaker.speak_notification(
-                notification.sender,
-                notification.message,
-            )
+            self._speak(notification.sender, notification.message)
             # SMS notification
-            self._sms_sender.send_notification(
-                notification.sender,
-                notification.message,
-            )
+            self._send_sms(notification.sender, notification.message)
 
     def start(self) -> None:
         """Start all detectors and begin monitoring."""
@@ -196,10 +203,11 @@ class NotificationMonitor:
         """Run the monitor until shutdown."""
         self.start()
 
-        # Wait for shutdown signal
+        # Wait for shutdown signal; set() wakes the wait immediately, the
+        # timeout only bounds how long a missed wakeup could go unnoticed
         try:
-            while not self.shutdown_event.is_set():
-                self.shutdown_event.wait(timeout=1.0)
+            while not self.shutdown_event.wait(timeout=60.0):
+                pass
         except KeyboardInterrupt:
             logger.info("Keyboard interrupt received")
 
@@ -215,7 +223,8 @@ class NotificationMonitor:
             except Exception as e:
                 logger.error(f"Error stopping {detector.name}: {e}")
 
-        self._speaker.stop()
+        self._speaker.close()
+        self._sms_sender.close()
 
         logger.info(
             f"Processed {self._notifications_processed} notifications, "
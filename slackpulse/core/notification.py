@@ -4,8 +4,10 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, Dict, Any
 
+from ..utils.compat import DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class SlackNotification:
     """Processed Slack notification ready for TTS."""
 
@@ -13,7 +15,7 @@ class SlackNotification:
     message: str
     timestamp: datetime = field(default_factory=datetime.now)
     source: str = "unknown"  # "distributed" or "filesystem"
-    metadata: Optional[Dict[str, Any]] = None
+    metadata: Optional[Dict[str, Any]] = field(default=None, compare=False)
 
     def __str__(self) -> str:
         return f"{self.sender}: {self.message}"
@@ -1,5 +1,6 @@
 """Notification database detector for reading actual Slack message content."""
 
+import functools
 import logging
 import os
 import plistlib
@@ -9,7 +10,7 @@ import threading
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, Optional, Set
+from typing import Callable, Optional
 from threading import Event
 
 from .base import BaseDetector
@@ -22,9 +23,35 @@ MAC_EPOCH_OFFSET = 978307200
 # Slack bundle identifier
 SLACK_BUNDLE_ID = "com.tinyspeck.slackmacgap"
 
+# Maps newlines/tabs to spaces in a single pass
+_WHITESPACE_TABLE = str.maketrans({"\n": " ", "\r": " ", "\t": " "})
 
+# Maximum number of notifications fetched per poll
+POLL_BATCH_SIZE = 10
+
+# Kept as one constant string so sqlite3's statement cache reuses the
+# compiled statement on every poll. Rows are read oldest first after a
+# (delivered_date, rowid) watermark, so no row is ever returned twice.
+_NEW_NOTIFICATIONS_SQL = f"""
+    SELECT rowid AS rid, data, delivered_date
+    FROM record
+    WHERE app_id = ?
+      AND (delivered_date > ? OR (delivered_date = ? AND rowid > ?))
+    ORDER BY delivered_date, rowid
+    LIMIT {POLL_BATCH_SIZE}
+"""
+
+
+@functools.lru_cache(maxsize=1)
 def get_darwin_user_dir() -> Optional[Path]:
-    """Get the DARWIN_USER_DIR using getconf."""
+    """Get the DARWIN_USER_DIR, preferring confstr over spawning getconf."""
+    try:
+        value = os.confstr("CS_DARWIN_USER_DIR")
+        return Path(value) if value else None
+    except (ValueError, OSError):
+        # Name unknown to this Python build; ask getconf instead
+        pass
+
     try:
         result = subprocess.run(
             ["getconf", "DARWIN_USER_DIR"],
@@ -91,7 +118,10 @@ class NotificationDatabaseDetector(BaseDetector):
         self._thread: Optional[threading.Thread] = None
         self._running = False
         self._last_timestamp: float = 0
-        self._seen_uuids: Set[bytes] = set()
+        self._last_rowid: int = 0
+        self._conn: Optional[sqlite3.Connection] = None
+        self._slack_app_id: Optional[int] = None
+        self._last_signature: Optional[tuple] = None
 
     @property
     def name(self) -> str:
@@ -134,96 +164,133 @@ class NotificationDatabaseDetector(BaseDetector):
                     self._running = False
                     break
                 else:
-                    logger.error(f"Database error: {e}")
+                    logger.error("Database error: %s", e)
+                    # Reopen on the next poll in case the file was replaced
+                    self._close_connection()
             except Exception as e:
-                logger.error(f"Error polling database: {e}", exc_info=True)
+                logger.error("Error polling database: %s", e, exc_info=True)
 
             self.shutdown_event.wait(timeout=self.poll_interval)
 
-    def _check_for_notifications(self) -> None:
-        """Check for new Slack notifications."""
-        if not self._db_path:
-            return
-
-        try:
-            # Open read-only connection
+    def _get_connection(self) -> sqlite3.Connection:
+        """Return the long-lived read-only connection, opening it on first use."""
+        if self._conn is None:
             uri = f"file:{self._db_path}?mode=ro"
-            conn = sqlite3.connect(uri, uri=True, timeout=5.0)
-            conn.row_factory = sqlite3.Row
+            self._conn = sqlite3.connect(
+                uri, uri=True, timeout=5.0, check_same_thread=False
+            )
+            self._conn.row_factory = sqlite3.Row
+        return self._conn
 
+    def _close_connection(self) -> None:
+        """Close the database connection if open."""
+        if self._conn is not None:
             try:
-                cursor = conn.execute(
-                    """
-                    SELECT
-                        record.uuid,
-                        record.data,
-                        record.delivered_date
-                    FROM record
-                    INNER JOIN app ON app.app_id = record.app_id
-                    WHERE app.identifier = ?
-                      AND record.delivered_date > ?
-                    ORDER BY record.delivered_date DESC
-                    LIMIT 10
-                    """,
-                    (SLACK_BUNDLE_ID, self._last_timestamp),
-                )
-
-                for row in cursor:
-                    uuid = row["uuid"]
-
-                    # Skip if already seen
-                    if uuid in self._seen_uuids:
-                        continue
-
-                    self._seen_uuids.add(uuid)
-
-                    # Update timestamp
-                    delivered = row["delivered_date"]
-                    if delivered > self._last_timestamp:
-                        self._last_timestamp = delivered
+                self._conn.close()
+            except sqlite3.Error:
+                pass
+            self._conn = None
+            self._slack_app_id = None
+            self._last_signature = None
+
+    def _lookup_slack_app_id(self, conn: sqlite3.Connection) -> Optional[int]:
+        """Resolve Slack's app_id (absent until Slack posts its first notification)."""
+        row = conn.execute(
+            "SELECT app_id FROM app WHERE identifier = ?", (SLACK_BUNDLE_ID,)
+        ).fetchone()
+        return row["app_id"] if row else None
+
+    def _db_signature(self) -> tuple:
+        """Return a cheap fingerprint of the database that changes on every write."""
+        db_stat = os.stat(self._db_path)
+        try:
+            # In WAL mode new rows land in the -wal file, not the main file
+            wal_stat = os.stat(f"{self._db_path}-wal")
+        except FileNotFoundError:
+            return (db_stat.st_mtime_ns, db_stat.st_size)
+        return (db_stat.st_mtime_ns, db_stat.st_size, wal_stat.st_mtime_ns, wal_stat.st_size)
 
-                    # Parse notification data
-                    sender, message = self._parse_notification(row["data"])
+    def _check_for_notifications(self) -> None:
+        """Check for new Slack notifications."""
+        if not self._db_path:
+            return
 
-                    if sender and message:
-                        logger.info(f"Slack notification: {sender}: {message[:50]}...")
-                        self.callback(
-                            sender,
-                            message,
-                            {"source": "database", "uuid": uuid.hex()},
-                        )
+        # Skip the query entirely when nothing has been written since last poll
+        signature = self._db_signature()
+        if signature == self._last_signature:
+            return
 
-                # Limit seen UUIDs cache size
-                if len(self._seen_uuids) > 1000:
-                    self._seen_uuids = set(list(self._seen_uuids)[-500:])
+        # A full batch may have left rows behind; query again next poll
+        if self._query_new_notifications() < POLL_BATCH_SIZE:
+            self._last_signature = signature
+
+    def _query_new_notifications(self) -> int:
+        """Fetch and dispatch notifications past the watermark; return rows read."""
+        conn = self._get_connection()
+
+        # Filter on the integer app_id instead of joining on the bundle string
+        if self._slack_app_id is None:
+            self._slack_app_id = self._lookup_slack_app_id(conn)
+            if self._slack_app_id is None:
+                return 0
+
+        cursor = conn.execute(
+            _NEW_NOTIFICATIONS_SQL,
+            (
+                self._slack_app_id,
+                self._last_timestamp,
+                self._last_timestamp,
+                self._last_rowid,
+            ),
+        )
 
-            finally:
-                conn.close()
+        rows = cursor.fetchmany(POLL_BATCH_SIZE)
+        for row in rows:
+            # Advance the watermark
+            delivered = row["delivered_date"]
+            self._last_timestamp = delivered
+            self._last_rowid = row["rid"]
+
+            # Parse notification data
+            sender, message = self._parse_notification(row["data"])
+
+            if sender and message:
+                logger.info("Slack notification: %s: %.50s...", sender, message)
+                self.callback(
+                    sender,
+                    message,
+                    {"source": "database", "delivered_date": delivered},
+                )
 
-        except Exception as e:
-            raise
+        return len(rows)
 
     def _parse_notification(self, data: bytes) -> tuple[str, str]:
         """Parse notification plist data to extract sender and message."""
         try:
-            plist = plistlib.loads(data)
-        except Exception as e:
-            logger.debug(f"Failed to parse plist: {e}")
-            return "", ""
+            # Notification Center stores binary plists; skip format sniffing
+            plist = plistlib.loads(data, fmt=plistlib.FMT_BINARY)
+        except Exception:
+            try:
+                plist = plistlib.loads(data)
+            except Exception as e:
+                logger.debug("Failed to parse plist: %s", e)
+                return "", ""
 
         # Modern format (macOS 10.13+)
-        req = plist.get("req", {})
+        get = plist.get("req", {}).get
+        clean = self._clean_string
 
-        title = self._clean_string(req.get("titl", ""))
-        subtitle = self._clean_string(req.get("subt", ""))
-        body = self._clean_string(req.get("body", ""))
+        title = clean(get("titl", ""))
+        subtitle = clean(get("subt", ""))
+        body = clean(get("body", ""))
 
         # Slack notification formats:
         # - DM: title=workspace, subtitle=sender, body=message
         # - Channel: title="Sender in #channel", subtitle=workspace, body=message
-        if " in #" in title:
+        channel_idx = title.find(" in #")
+        if channel_idx >= 0:
             # Channel message: "Sender in #channel"
-            sender = title.split(" in #")[0].strip()
+            sender = title[:channel_idx].strip()
         elif subtitle:
             # DM: subtitle is the sender name
             sender = subtitle
@@ -258,8 +325,12 @@ class NotificationDatabaseDetector(BaseDetector):
         except Exception:
             return "", ""
 
-    def _clean_string(self, value) -> str:
+    @staticmethod
+    def _clean_string(value) -> str:
         """Clean a value to a string."""
+        # Plist strings are the common case; check the exact type first
+        if type(value) is str:
+            return value.translate(_WHITESPACE_TABLE).strip()
         if value is None:
             return ""
         if isinstance(value, bytes):
@@ -267,12 +338,12 @@ class NotificationDatabaseDetector(BaseDetector):
                 return value.decode("utf-8")
             except UnicodeDecodeError:
                 return ""
-        s = str(value)
-        return s.replace("\n", " ").replace("\r", " ").replace("\t", " ").strip()
+        return str(value).translate(_WHITESPACE_TABLE).strip()
 
     def stop(self) -> None:
         """Stop the detector."""
         self._running = False
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=2.0)
+        self._close_connection()
         logger.info(f"Stopped {self.name}")
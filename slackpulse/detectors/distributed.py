@@ -2,6 +2,7 @@
 
 import logging
 import threading
+import time
 from typing import Callable, Optional, Set
 from threading import Event
 
@@ -11,6 +12,8 @@ from Foundation import (
     NSRunLoop,
     NSDate,
     NSDefaultRunLoopMode,
+    NSCaseInsensitiveSearch,
+    NSNotFound,
 )
 import objc
 
@@ -18,6 +21,37 @@ from .base import BaseDetector
 
 logger = logging.getLogger(__name__)
 
+# Run loop spin interval right after a notification and when idle
+ACTIVE_RUN_INTERVAL = 0.02
+IDLE_RUN_INTERVAL = 0.5
+
+# Seconds after the last notification before relaxing to the idle interval
+ACTIVE_WINDOW_SECONDS = 5.0
+
+# Substrings marking Slack-related notification names and sending objects
+# ("slackmacgap" is covered by "slack")
+_SLACK_MARKERS = ("slack", "tinyspeck")
+
+# userInfo keys probed, in order of preference, for sender and message text
+_SENDER_KEYS = ("title", "sender", "from")
+_MESSAGE_KEYS = ("body", "message", "text")
+
+
+def _mentions_slack(value) -> bool:
+    """Case-insensitively test an NSString for a Slack marker without converting it."""
+    if value is None:
+        return False
+    try:
+        find = value.rangeOfString_options_
+    except AttributeError:
+        # Not an NSString (e.g. an NSNumber object); compare its description
+        text = str(value).lower()
+        return any(marker in text for marker in _SLACK_MARKERS)
+    for marker in _SLACK_MARKERS:
+        if find(marker, NSCaseInsensitiveSearch).location != NSNotFound:
+            return True
+    return False
+
 
 class NotificationObserver(NSObject):
     """Objective-C observer class for distributed notifications."""
@@ -29,11 +63,7 @@ class NotificationObserver(NSObject):
             return None
         self._callback = callback
         self._discovery_mode = discovery_mode
-        self._slack_patterns = {
-            "slack",
-            "tinyspeck",
-            "slackmacgap",
-        }
+        self.last_event_time = 0.0  # time.monotonic() of last handled notification
         return self
 
     def handleNotification_(self, notification):
@@ -41,31 +71,27 @@ class NotificationObserver(NSObject):
         try:
             name = notification.name()
             obj = notification.object()
-            user_info = notification.userInfo()
-
-            name_str = str(name) if name else ""
-            obj_str = str(obj) if obj else ""
 
             # In discovery mode, log everything
             if self._discovery_mode:
-                logger.info(f"[DISCOVERY] name={name_str}, object={obj_str}, info={user_info}")
+                self.last_event_time = time.monotonic()
+                logger.info(
+                    f"[DISCOVERY] name={name or ''}, object={obj or ''}, "
+                    f"info={notification.userInfo()}"
+                )
                 return
 
-            # Check if this is Slack-related
-            name_lower = name_str.lower()
-            obj_lower = obj_str.lower()
-
-            is_slack = any(
-                pattern in name_lower or pattern in obj_lower
-                for pattern in self._slack_patterns
-            )
+            # Drop non-Slack notifications before building any Python strings
+            if not (_mentions_slack(name) or _mentions_slack(obj)):
+                return
 
-            if is_slack:
-                logger.debug(f"Slack notification: {name_str}")
-                # Try to extract sender/message from userInfo
-                sender, message = self._extract_message_info(user_info, name_str)
-                if sender and message:
-                    self._callback(sender, message, {"source": "distributed", "name": name_str})
+            self.last_event_time = time.monotonic()
+            name_str = str(name) if name else ""
+            logger.debug(f"Slack notification: {name_str}")
+            # Try to extract sender/message from userInfo
+            sender, message = self._extract_message_info(notification.userInfo(), name_str)
+            if sender and message:
+                self._callback(sender, message, {"source": "distributed", "name": name_str})
 
         except Exception as e:
             logger.error(f"Error handling notification: {e}", exc_info=True)
@@ -75,24 +101,22 @@ class NotificationObserver(NSObject):
         if not user_info:
             return "", ""
 
-        # Try common keys that Slack might use
+        # Try common keys that Slack might use, title/body first. objectForKey_
+        # resolves one key at a time instead of bridging the whole NSDictionary.
         sender = ""
         message = ""
 
-        # Check for title/body pattern
-        if "title" in user_info:
-            sender = str(user_info["title"])
-        elif "sender" in user_info:
-            sender = str(user_info["sender"])
-        elif "from" in user_info:
-            sender = str(user_info["from"])
-
-        if "body" in user_info:
-            message = str(user_info["body"])
-        elif "message" in user_info:
-            message = str(user_info["message"])
-        elif "text" in user_info:
-            message = str(user_info["text"])
+        for key in _SENDER_KEYS:
+            value = user_info.objectForKey_(key)
+            if value is not None:
+                sender = str(value)
+                break
+
+        for key in _MESSAGE_KEYS:
+            value = user_info.objectForKey_(key)
+            if value is not None:
+                message = str(value)
+                break
 
         return sender, message
 
@@ -105,6 +129,14 @@ class DistributedNotificationDetector(BaseDetector):
     No special permissions required.
     """
 
+    # Notification names Slack is known to post; observed by default so the
+    # notification center filters out other apps' traffic
+    KNOWN_SLACK_NAMES = frozenset({
+        "com.tinyspeck.slackmacgap.notification",
+        "com.tinyspeck.slackmacgap",
+        "SlackNotification",
+    })
+
     def __init__(
         self,
         callback: Callable[[str, str, Optional[dict]], None],
@@ -120,7 +152,8 @@ class DistributedNotificationDetector(BaseDetector):
             shutdown_event: Event to signal shutdown.
             discovery_mode: If True, log all notifications for discovery.
             notification_names: Specific notification names to listen for.
-                               If None, listens to all notifications.
+                               If None, listens to KNOWN_SLACK_NAMES, or to all
+                               notifications in discovery mode.
         """
         super().__init__(callback, shutdown_event)
         self.discovery_mode = discovery_mode
@@ -160,9 +193,13 @@ class DistributedNotificationDetector(BaseDetector):
             self._center = NSDistributedNotificationCenter.defaultCenter()
 
             # Register for notifications
-            if self.notification_names:
+            names = self.notification_names
+            if not names and not self.discovery_mode:
+                names = self.KNOWN_SLACK_NAMES
+
+            if names:
                 # Listen to specific notification names
-                for notif_name in self.notification_names:
+                for notif_name in names:
                     self._center.addObserver_selector_name_object_(
                         self._observer,
                         "handleNotification:",
@@ -171,7 +208,7 @@ class DistributedNotificationDetector(BaseDetector):
                     )
                     logger.debug(f"Listening for: {notif_name}")
             else:
-                # Listen to all notifications (for discovery or broad monitoring)
+                # Listen to all notifications (discovery)
                 self._center.addObserver_selector_name_object_(
                     self._observer,
                     "handleNotification:",
@@ -183,11 +220,20 @@ class DistributedNotificationDetector(BaseDetector):
             # Run the event loop
             run_loop = NSRunLoop.currentRunLoop()
             while self._running and not self.shutdown_event.is_set():
-                # Run loop for a short interval, then check shutdown
-                run_loop.runMode_beforeDate_(
-                    NSDefaultRunLoopMode,
-                    NSDate.dateWithTimeIntervalSinceNow_(0.5),
+                # Spin quickly while notifications are arriving, relax when idle
+                idle_for = time.monotonic() - self._observer.last_event_time
+                interval = (
+                    ACTIVE_RUN_INTERVAL
+                    if idle_for < ACTIVE_WINDOW_SECONDS
+                    else IDLE_RUN_INTERVAL
                 )
+                # Run loop for a short interval, then check shutdown; the pool
+                # drains Foundation temporaries created during each spin
+                with objc.autorelease_pool():
+                    run_loop.runMode_beforeDate_(
+                        NSDefaultRunLoopMode,
+                        NSDate.dateWithTimeIntervalSinceNow_(interval),
+                    )
 
         except Exception as e:
             logger.error(f"Error in notification loop: {e}", exc_info=True)
@@ -2,41 +2,56 @@
 
 import logging
 import os
-import time
 import threading
 from pathlib import Path
-from typing import Callable, Optional, Set
+from typing import Callable, List, Optional
 from threading import Event
 
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler, FileSystemEvent
 
+from ..filters.pathmatch import PATH_OTHER, classify, is_ignored
 from .base import BaseDetector
 
 logger = logging.getLogger(__name__)
 
 
+def schedule_scoped_watches(
+    observer: Observer,
+    handler: FileSystemEventHandler,
+    root: Path,
+    accept: Callable[[str], bool],
+) -> List[str]:
+    """
+    Watch only the top-level directories of root whose names pass accept.
+
+    Noisy siblings such as GPUCache are never subscribed to, so their
+    events are dropped by the OS rather than in Python. Directories created
+    after this call are not picked up. Falls back to one recursive watch on
+    root when nothing matches.
+
+    Returns:
+        The watched paths.
+    """
+    watched: List[str] = []
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False) and accept(entry.name):
+                    observer.schedule(handler, entry.path, recursive=True)
+                    watched.append(entry.path)
+    except OSError as e:
+        logger.debug(f"Could not scan {root}: {e}")
+
+    if not watched:
+        observer.schedule(handler, str(root), recursive=True)
+        watched.append(str(root))
+    return watched
+
+
 class SlackFileHandler(FileSystemEventHandler):
     """Handle file system events in Slack's data directory."""
 
-    # Files/paths that indicate message activity
-    ACTIVITY_PATTERNS = {
-        "Local Storage",
-        "leveldb",
-        "IndexedDB",
-        ".log",
-        "Cache",
-    }
-
-    # Paths to ignore (noisy, not message-related)
-    IGNORE_PATTERNS = {
-        "GPUCache",
-        "Code Cache",
-        "blob_storage",
-        "Session Storage",
-        ".tmp",
-    }
-
     def __init__(
         self,
         callback: Callable[[], None],
@@ -47,38 +62,45 @@ class SlackFileHandler(FileSystemEventHandler):
 
         Args:
             callback: Function to call when Slack activity detected.
-            debounce_seconds: Minimum time between callback invocations.
+            debounce_seconds: Delay after the first event of a burst before the
+                              callback fires once for the whole burst.
         """
         super().__init__()
         self._callback = callback
         self._debounce_seconds = debounce_seconds
-        self._last_callback_time: float = 0
+        self._timer: Optional[threading.Timer] = None
         self._lock = threading.Lock()
 
-    def _should_ignore(self, path: str) -> bool:
-        """Check if this path should be ignored."""
-        for pattern in self.IGNORE_PATTERNS:
-            if pattern in path:
-                return True
-        return False
-
-    def _is_activity_indicator(self, path: str) -> bool:
+    def _is_activity(self, path: str) -> bool:
         """Check if this path indicates message activity."""
-        for pattern in self.ACTIVITY_PATTERNS:
-            if pattern in path:
-                return True
-        return False
+        return classify(path) != PATH_OTHER
 
     def _trigger_callback(self) -> None:
-        """Trigger callback with debouncing."""
+        """Schedule the callback, coalescing a burst of events into one call."""
+        # Unlocked fast path: a timer is already armed for this burst
+        if self._timer is not None:
+            return
+        with self._lock:
+            if self._timer is None:
+                self._timer = threading.Timer(self._debounce_seconds, self._fire)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _fire(self) -> None:
+        """Run the callback once for the burst that armed the timer."""
+        with self._lock:
+            self._timer = None
+        try:
+            self._callback()
+        except Exception as e:
+            logger.error(f"Error in file event callback: {e}")
+
+    def cancel(self) -> None:
+        """Cancel a pending callback."""
         with self._lock:
-            now = time.time()
-            if now - self._last_callback_time >= self._debounce_seconds:
-                self._last_callback_time = now
-                try:
-                    self._callback()
-                except Exception as e:
-                    logger.error(f"Error in file event callback: {e}")
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
 
     def on_modified(self, event: FileSystemEvent) -> None:
         """Handle file modification events."""
@@ -86,10 +108,7 @@ class SlackFileHandler(FileSystemEventHandler):
             return
 
         path = event.src_path
-        if self._should_ignore(path):
-            return
-
-        if self._is_activity_indicator(path):
+        if self._is_activity(path):
             logger.debug(f"Slack activity detected: {path}")
             self._trigger_callback()
 
@@ -99,10 +118,7 @@ class SlackFileHandler(FileSystemEventHandler):
             return
 
         path = event.src_path
-        if self._should_ignore(path):
-            return
-
-        if self._is_activity_indicator(path):
+        if self._is_activity(path):
             logger.debug(f"Slack file created: {path}")
             self._trigger_callback()
 
@@ -170,13 +186,14 @@ class FileSystemDetector(BaseDetector):
         )
 
         self._observer = Observer()
-        self._observer.schedule(
+        watched = schedule_scoped_watches(
+            self._observer,
             self._handler,
-            str(self.slack_path),
-            recursive=True,
+            self.slack_path,
+            accept=lambda name: not is_ignored(name),
         )
         self._observer.start()
-        logger.info(f"Started {self.name} watching: {self.slack_path}")
+        logger.info(f"Started {self.name} watching: {', '.join(watched)}")
 
     def stop(self) -> None:
         """Stop the filesystem observer."""
@@ -184,4 +201,7 @@ class FileSystemDetector(BaseDetector):
             self._observer.stop()
             self._observer.join(timeout=2.0)
             self._observer = None
+        if self._handler:
+            self._handler.cancel()
+            self._handler = None
         logger.info(f"Stopped {self.name}")
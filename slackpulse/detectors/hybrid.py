@@ -3,63 +3,48 @@
 import logging
 import sqlite3
 import plistlib
-import subprocess
+import queue
 import threading
 import time
-from datetime import datetime
+from collections import OrderedDict
 from pathlib import Path
-from typing import Callable, Optional, Set
+from typing import Callable, Optional
 from threading import Event, Lock
 
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler, FileSystemEvent
 
+from ..filters.pathmatch import PATH_STORAGE, classify
 from .base import BaseDetector
+from .database import MAC_EPOCH_OFFSET, SLACK_BUNDLE_ID, find_notification_database
+from .filesystem import schedule_scoped_watches
 
 logger = logging.getLogger(__name__)
 
-MAC_EPOCH_OFFSET = 978307200
-SLACK_BUNDLE_ID = "com.tinyspeck.slackmacgap"
-
-
-def find_notification_database() -> Optional[Path]:
-    """Find the notification database path."""
-    sequoia_path = (
-        Path.home()
-        / "Library"
-        / "Group Containers"
-        / "group.com.apple.usernoted"
-        / "db2"
-        / "db"
-    )
-    if sequoia_path.exists():
-        return sequoia_path
-
-    # Try legacy location
-    try:
-        result = subprocess.run(
-            ["getconf", "DARWIN_USER_DIR"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        if result.returncode == 0:
-            darwin_dir = Path(result.stdout.strip())
-            legacy_path = darwin_dir / "com.apple.notificationcenter" / "db2" / "db"
-            if legacy_path.exists():
-                return legacy_path
-    except Exception:
-        pass
+# Maximum number of notification UUIDs remembered between lookups
+MAX_SEEN_UUIDS = 500
+
+# Pending activity signals; overflow is dropped since a queued lookup covers it
+ACTIVITY_QUEUE_SIZE = 16
+
+# Signals arriving this soon after the first of a burst share one lookup
+COALESCE_SECONDS = 0.05
 
-    return None
+# Reused verbatim on every lookup so sqlite3's statement cache keeps it compiled
+_RECENT_NOTIFICATIONS_SQL = """
+    SELECT record.uuid, record.data, record.delivered_date
+    FROM record
+    INNER JOIN app ON app.app_id = record.app_id
+    WHERE app.identifier = ?
+      AND record.delivered_date > ?
+    ORDER BY record.delivered_date DESC
+    LIMIT 5
+"""
 
 
 class SlackActivityHandler(FileSystemEventHandler):
     """Handle file system events in Slack's data directory."""
 
-    ACTIVITY_PATTERNS = {"Local Storage", "leveldb", "IndexedDB"}
-    IGNORE_PATTERNS = {"GPUCache", "Code Cache", "blob_storage", "Session Storage", ".tmp"}
-
     def __init__(self, callback: Callable[[], None], debounce_seconds: float = 1.5):
         super().__init__()
         self._callback = callback
@@ -68,13 +53,7 @@ class SlackActivityHandler(FileSystemEventHandler):
         self._lock = Lock()
 
     def _should_trigger(self, path: str) -> bool:
-        for pattern in self.IGNORE_PATTERNS:
-            if pattern in path:
-                return False
-        for pattern in self.ACTIVITY_PATTERNS:
-            if pattern in path:
-                return True
-        return False
+        return classify(path) == PATH_STORAGE
 
     def _trigger(self) -> None:
         with self._lock:
@@ -119,16 +98,52 @@ class HybridDetector(BaseDetector):
         self.debounce_seconds = debounce_seconds
         self._db_path = find_notification_database()
         self._observer: Optional[Observer] = None
-        self._seen_uuids: Set[bytes] = set()
+        self._seen_uuids: OrderedDict[bytes, None] = OrderedDict()
         self._last_db_check: float = 0
+        self._conn: Optional[sqlite3.Connection] = None
         self._lock = Lock()
+        self._queue: "queue.Queue[float]" = queue.Queue(maxsize=ACTIVITY_QUEUE_SIZE)
+        self._worker: Optional[threading.Thread] = None
+        self._running = False
 
     @property
     def name(self) -> str:
         return "HybridDetector"
 
     def _on_slack_activity(self) -> None:
-        """Called when filesystem activity detected."""
+        """Called on the watchdog thread when filesystem activity detected."""
+        # Hand off to the worker so the observer thread never waits on SQLite
+        try:
+            self._queue.put_nowait(time.monotonic())
+        except queue.Full:
+            pass
+
+    def _consume(self) -> None:
+        """Worker loop: run one database lookup per burst of activity signals."""
+        while self._running:
+            try:
+                first = self._queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+
+            # Fold signals from the same burst into this lookup
+            deadline = first + COALESCE_SECONDS
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+
+            try:
+                self._process_activity()
+            except Exception as e:
+                logger.error(f"Callback error: {e}")
+
+    def _process_activity(self) -> None:
+        """Look up the notification behind an activity signal and report it."""
         # Check database for new notifications
         notification = self._get_latest_notification()
 
@@ -141,67 +156,81 @@ class HybridDetector(BaseDetector):
             logger.info("Slack activity detected (no new notification in database)")
             self.callback("Slack", "New activity detected", {"source": "hybrid-filesystem"})
 
+    def _get_connection(self) -> sqlite3.Connection:
+        """Return the long-lived read-only connection, opening it on first use."""
+        if self._conn is None:
+            uri = f"file:{self._db_path}?mode=ro"
+            conn = sqlite3.connect(
+                uri,
+                uri=True,
+                timeout=5.0,
+                check_same_thread=False,
+                isolation_level=None,
+            )
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA query_only = 1")
+            conn.execute("PRAGMA temp_store = MEMORY")
+            conn.execute("PRAGMA cache_size = -2000")
+            self._conn = conn
+        return self._conn
+
+    def _close_connection(self) -> None:
+        """Close the database connection if open."""
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except sqlite3.Error:
+                pass
+            self._conn = None
+
     def _get_latest_notification(self) -> Optional[tuple[str, str]]:
         """Check database for new Slack notifications."""
         if not self._db_path:
             return None
 
-        with self._lock:
-            try:
-                uri = f"file:{self._db_path}?mode=ro"
-                conn = sqlite3.connect(uri, uri=True, timeout=5.0)
-                conn.row_factory = sqlite3.Row
-
-                # Get recent notifications (last 30 seconds)
-                cutoff = datetime.utcnow().timestamp() - MAC_EPOCH_OFFSET - 30
-
-                cursor = conn.execute(
-                    """
-                    SELECT record.uuid, record.data, record.delivered_date
-                    FROM record
-                    INNER JOIN app ON app.app_id = record.app_id
-                    WHERE app.identifier = ?
-                      AND record.delivered_date > ?
-                    ORDER BY record.delivered_date DESC
-                    LIMIT 5
-                    """,
-                    (SLACK_BUNDLE_ID, cutoff),
-                )
-
-                for row in cursor:
-                    uuid = row["uuid"]
+        try:
+            with self._lock:
+                conn = self._get_connection()
+
+            # Get recent notifications (last 30 seconds). The lock only
+            # guards opening/closing the connection and the seen-UUID set;
+            # lookups all run on the single worker thread.
+            cutoff = time.time() - MAC_EPOCH_OFFSET - 30
+
+            cursor = conn.execute(_RECENT_NOTIFICATIONS_SQL, (SLACK_BUNDLE_ID, cutoff))
+
+            for row in cursor:
+                uuid = row["uuid"]
+                with self._lock:
                     if uuid in self._seen_uuids:
                         continue
+                    self._seen_uuids[uuid] = None
+                    if len(self._seen_uuids) > MAX_SEEN_UUIDS:
+                        self._seen_uuids.popitem(last=False)  # Evict oldest
 
-                    self._seen_uuids.add(uuid)
-
-                    # Parse notification
-                    try:
-                        plist = plistlib.loads(row["data"])
-                        req = plist.get("req", {})
-                        title = str(req.get("titl", ""))
-                        body = str(req.get("body", ""))
-
-                        if title and body:
-                            sender = title.split(" in #")[0] if " in #" in title else title
-                            conn.close()
-                            return (sender, body)
-                    except Exception as e:
-                        logger.debug(f"Parse error: {e}")
-
-                conn.close()
-
-                # Limit cache size
-                if len(self._seen_uuids) > 500:
-                    self._seen_uuids = set(list(self._seen_uuids)[-250:])
-
-            except sqlite3.OperationalError as e:
-                if "unable to open" in str(e).lower():
-                    logger.warning("Cannot access notification database")
-                else:
-                    logger.error(f"Database error: {e}")
-            except Exception as e:
-                logger.error(f"Error checking database: {e}")
+                # Parse notification
+                try:
+                    plist = plistlib.loads(row["data"])
+                    req = plist.get("req", {})
+                    title = str(req.get("titl", ""))
+                    body = str(req.get("body", ""))
+
+                    if title and body:
+                        sender = title.split(" in #")[0] if " in #" in title else title
+                        return (sender, body)
+                except Exception as e:
+                    logger.debug(f"Parse error: {e}")
+
+        except sqlite3.OperationalError as e:
+            if "unable to open" in str(e).lower():
+                logger.warning("Cannot access notification database")
+            else:
+                logger.error(f"Database error: {e}")
+            # Reopen on the next lookup
+            with self._lock:
+                self._close_connection()
+        except Exception as e:
+            logger.error(f"Error checking database: {e}")
 
         return None
 
@@ -216,15 +245,25 @@ class HybridDetector(BaseDetector):
         else:
             logger.warning("Notification database not found - will only detect activity")
 
+        self._running = True
+        self._worker = threading.Thread(target=self._consume, daemon=True)
+        self._worker.start()
+
         handler = SlackActivityHandler(
             callback=self._on_slack_activity,
             debounce_seconds=self.debounce_seconds,
         )
 
+        # Only the message stores can trigger, so only they are watched
         self._observer = Observer()
-        self._observer.schedule(handler, str(self.SLACK_PATH), recursive=True)
+        watched = schedule_scoped_watches(
+            self._observer,
+            handler,
+            self.SLACK_PATH,
+            accept=lambda name: classify(name) == PATH_STORAGE,
+        )
         self._observer.start()
-        logger.info(f"Started {self.name} watching: {self.SLACK_PATH}")
+        logger.info(f"Started {self.name} watching: {', '.join(watched)}")
 
     def stop(self) -> None:
         """Stop the detector."""
@@ -232,4 +271,10 @@ class HybridDetector(BaseDetector):
             self._observer.stop()
             self._observer.join(timeout=2.0)
             self._observer = None
+        self._running = False
+        if self._worker and self._worker.is_alive():
+            self._worker.join(timeout=2.0)
+        self._worker = None
+        with self._lock:
+            self._close_connection()
         logger.info(f"Stopped {self.name}")
@@ -2,16 +2,74 @@
 
 import re
 import logging
-from typing import List, Set
+from typing import Iterable, Optional, Sequence, Tuple
 
 logger = logging.getLogger(__name__)
 
 
+# A leading global inline flag group such as "(?i)"
+_GLOBAL_FLAGS_RE = re.compile(r"\(\?[aiLmsux]+\)")
+
+# Flags every pattern is compiled with; anything else came from inline flags
+_BASE_FLAGS = re.compile("", re.IGNORECASE).flags
+
+
+def _compile_patterns(patterns: Iterable[str]) -> Tuple["re.Pattern[str]", ...]:
+    """
+    Compile patterns into case-insensitive regexes to try in turn.
+
+    Each pattern is compiled on its own first. When none of them uses
+    groups or inline flags, they are merged into a single alternation so a
+    message is scanned once; otherwise joining them would renumber
+    backreferences or collide group names, so they stay separate.
+
+    Raises:
+        ValueError: If a pattern is not a valid regex.
+    """
+    sources = list(patterns)
+    compiled = []
+    for pattern in sources:
+        try:
+            compiled.append(re.compile(pattern, re.IGNORECASE))
+        except re.error as e:
+            raise ValueError(f"Invalid bot pattern {pattern!r}: {e}") from e
+
+    if not compiled:
+        return ()
+    if len(compiled) == 1:
+        return tuple(compiled)
+
+    combinable = all(
+        regex.groups == 0
+        and regex.flags == _BASE_FLAGS
+        and not _GLOBAL_FLAGS_RE.match(pattern)
+        for pattern, regex in zip(sources, compiled)
+    )
+    if combinable:
+        try:
+            combined = "|".join(f"(?:{p})" for p in sources)
+            return (re.compile(combined, re.IGNORECASE),)
+        except re.error:
+            pass
+    return tuple(compiled)
+
+
+def _search(
+    regexes: Tuple["re.Pattern[str]", ...], text: str
+) -> Optional["re.Match[str]"]:
+    """Return the first match of any regex in text, or None."""
+    for regex in regexes:
+        match = regex.search(text)
+        if match:
+            return match
+    return None
+
+
 class BotFilter:
     """Detect and filter bot/automated messages."""
 
     # Default patterns for bot sender names (case-insensitive)
-    DEFAULT_BOT_PATTERNS = [
+    DEFAULT_BOT_PATTERNS = (
         r"\bbot\b",
         r"slackbot",
         r"workflow",
@@ -19,10 +77,11 @@ class BotFilter:
         r"\bapp\b",
         r"integration",
         r"webhook",
-    ]
+    )
 
-    # Default keywords indicating automated messages (in message body)
-    DEFAULT_BOT_KEYWORDS = [
+    # Default keywords indicating automated messages (in message body),
+    # already lowercase
+    DEFAULT_BOT_KEYWORDS = (
         "has joined the channel",
         "has left the channel",
         "set the channel topic",
@@ -33,12 +92,16 @@ class BotFilter:
         "archived the channel",
         "unarchived the channel",
         "renamed the channel",
-    ]
+    )
+
+    # The defaults are shared by every filter, so compile them once
+    _DEFAULT_NAME_REGEXES = _compile_patterns(DEFAULT_BOT_PATTERNS)
+    _DEFAULT_KEYWORD_REGEXES = _compile_patterns(map(re.escape, DEFAULT_BOT_KEYWORDS))
 
     def __init__(
         self,
-        bot_patterns: List[str] = None,
-        bot_keywords: List[str] = None,
+        bot_patterns: Optional[Sequence[str]] = None,
+        bot_keywords: Optional[Sequence[str]] = None,
     ):
         """
         Initialize the bot filter.
@@ -47,13 +110,21 @@ class BotFilter:
             bot_patterns: Regex patterns for bot sender names.
             bot_keywords: Substrings that indicate automated messages.
         """
-        patterns = bot_patterns or self.DEFAULT_BOT_PATTERNS
-        self._bot_name_patterns = [
-            re.compile(pattern, re.IGNORECASE) for pattern in patterns
-        ]
-        self._bot_keywords = [
-            kw.lower() for kw in (bot_keywords or self.DEFAULT_BOT_KEYWORDS)
-        ]
+        if bot_patterns:
+            self._bot_name_patterns = list(bot_patterns)
+            self._bot_name_regexes = _compile_patterns(self._bot_name_patterns)
+        else:
+            self._bot_name_patterns = list(self.DEFAULT_BOT_PATTERNS)
+            self._bot_name_regexes = self._DEFAULT_NAME_REGEXES
+
+        if bot_keywords:
+            self._bot_keywords = [kw.lower() for kw in bot_keywords]
+            self._bot_keyword_regexes = _compile_patterns(
+                map(re.escape, self._bot_keywords)
+            )
+        else:
+            self._bot_keywords = list(self.DEFAULT_BOT_KEYWORDS)
+            self._bot_keyword_regexes = self._DEFAULT_KEYWORD_REGEXES
 
     def is_bot_message(self, sender: str, message: str) -> bool:
         """
@@ -66,27 +137,29 @@ class BotFilter:
         Returns:
             True if this appears to be a bot/automated message.
         """
-        sender_lower = sender.lower()
-        message_lower = message.lower()
-
+        # All regexes are case-insensitive, so no lowercased copies are needed.
         # Check sender name against bot patterns
-        for pattern in self._bot_name_patterns:
-            if pattern.search(sender_lower):
-                logger.debug(f"Bot detected by name pattern: {sender}")
-                return True
+        if _search(self._bot_name_regexes, sender):
+            logger.debug(f"Bot detected by name pattern: {sender}")
+            return True
 
         # Check message body for automation keywords
-        for keyword in self._bot_keywords:
-            if keyword in message_lower:
-                logger.debug(f"Bot detected by keyword: {keyword}")
-                return True
+        match = _search(self._bot_keyword_regexes, message)
+        if match:
+            logger.debug(f"Bot detected by keyword: {match.group(0)}")
+            return True
 
         return False
 
     def add_bot_pattern(self, pattern: str) -> None:
         """Add a new bot name pattern."""
-        self._bot_name_patterns.append(re.compile(pattern, re.IGNORECASE))
+        patterns = self._bot_name_patterns + [pattern]
+        self._bot_name_regexes = _compile_patterns(patterns)
+        self._bot_name_patterns = patterns
 
     def add_bot_keyword(self, keyword: str) -> None:
         """Add a new bot keyword."""
         self._bot_keywords.append(keyword.lower())
+        self._bot_keyword_regexes = _compile_patterns(
+            map(re.escape, self._bot_keywords)
+        )
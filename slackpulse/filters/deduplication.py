@@ -3,8 +3,9 @@
 import hashlib
 import time
 import logging
-from collections import OrderedDict
+from collections import deque
 from threading import Lock
+from typing import Deque, Dict, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -25,30 +26,36 @@ class DeduplicationCache:
             window_seconds: Time window for deduplication (default 30s).
         """
         self.window_seconds = window_seconds
-        self._cache: OrderedDict[str, float] = OrderedDict()
+        self._cache: Dict[bytes, float] = {}
+        # (hash, timestamp) in insertion order, i.e. oldest first
+        self._order: Deque[Tuple[bytes, float]] = deque()
+        self._last_cleanup: float = 0.0
         self._lock = Lock()
 
-    def _compute_hash(self, sender: str, message: str) -> str:
-        """Compute content hash for deduplication."""
-        content = f"{sender.lower().strip()}:{message.lower().strip()}"
-        return hashlib.sha256(content.encode()).hexdigest()[:16]
+    def _compute_hash(self, sender: str, message: str) -> bytes:
+        """
+        Compute content hash for deduplication (8 raw bytes).
+
+        Normalization runs on the encoded bytes, so case folding and
+        whitespace trimming cover ASCII only.
+        """
+        h = hashlib.blake2b(digest_size=8)
+        h.update(sender.encode().strip().lower())
+        h.update(b"\x1f")  # Unit separator keeps sender/message boundaries distinct
+        h.update(message.encode().strip().lower())
+        return h.digest()
 
-    def _cleanup_expired(self) -> None:
+    def _cleanup_expired(self, current_time: float) -> None:
         """Remove expired entries from cache."""
-        current_time = time.time()
         cutoff = current_time - self.window_seconds
 
-        # Remove entries older than window
-        # OrderedDict maintains insertion order, so we can iterate from oldest
-        expired_keys = []
-        for key, timestamp in self._cache.items():
-            if timestamp < cutoff:
-                expired_keys.append(key)
-            else:
-                break  # All subsequent entries are newer
-
-        for key in expired_keys:
-            del self._cache[key]
+        # Entries are appended in time order, so expired ones are at the left
+        order = self._order
+        while order and order[0][1] < cutoff:
+            key, timestamp = order.popleft()
+            # Skip keys re-added since this entry was queued
+            if self._cache.get(key) == timestamp:
+                del self._cache[key]
 
     def is_duplicate(self, sender: str, message: str) -> bool:
         """
@@ -64,24 +71,32 @@ class DeduplicationCache:
         Returns:
             True if duplicate, False if new.
         """
-        with self._lock:
-            self._cleanup_expired()
+        content_hash = self._compute_hash(sender, message)
 
-            content_hash = self._compute_hash(sender, message)
+        with self._lock:
             current_time = time.time()
 
-            if content_hash in self._cache:
+            # Sweeping on every call buys nothing during bursts
+            if current_time - self._last_cleanup > self.window_seconds / 32:
+                self._cleanup_expired(current_time)
+                self._last_cleanup = current_time
+
+            # Entries may outlive the window until the next sweep; check age too
+            seen_at = self._cache.get(content_hash)
+            if seen_at is not None and seen_at >= current_time - self.window_seconds:
                 logger.debug(f"Duplicate notification detected: {sender}")
                 return True
 
             # Add to cache
             self._cache[content_hash] = current_time
+            self._order.append((content_hash, current_time))
             return False
 
     def clear(self) -> None:
         """Clear all cached entries."""
         with self._lock:
             self._cache.clear()
+            self._order.clear()
 
     def __len__(self) -> int:
         """Return number of entries in cache."""
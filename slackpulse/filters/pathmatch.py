@@ -0,0 +1,51 @@
+"""Classification of paths inside Slack's data directory."""
+
+import re
+
+# Noisy paths that are never message-related
+IGNORE_PATTERNS = ("GPUCache", "Code Cache", "blob_storage", "Session Storage", ".tmp")
+
+# Slack's local message stores
+STORAGE_PATTERNS = ("Local Storage", "leveldb", "IndexedDB")
+
+# Weaker hints of activity (logs, HTTP cache)
+ACTIVITY_PATTERNS = (".log", "Cache")
+
+# classify() results
+PATH_OTHER = 0  # Ignored or unrelated
+PATH_STORAGE = 1  # Inside a message store
+PATH_ACTIVITY = 2  # Other activity hint
+
+
+def _alternation(patterns: tuple) -> "re.Pattern[str]":
+    return re.compile("|".join(map(re.escape, patterns)))
+
+
+# Compiled once at import and shared by every handler
+_IGNORE_RE = _alternation(IGNORE_PATTERNS)
+_STORAGE_RE = _alternation(STORAGE_PATTERNS)
+_ACTIVITY_RE = _alternation(ACTIVITY_PATTERNS)
+
+
+def is_ignored(path: str) -> bool:
+    """Return True if the path is in a noisy, non-message location."""
+    return _IGNORE_RE.search(path) is not None
+
+
+def classify(path: str) -> int:
+    """
+    Classify a path for activity detection.
+
+    Args:
+        path: File system path (or path component) to classify.
+
+    Returns:
+        PATH_STORAGE, PATH_ACTIVITY, or PATH_OTHER.
+    """
+    if _IGNORE_RE.search(path):
+        return PATH_OTHER
+    if _STORAGE_RE.search(path):
+        return PATH_STORAGE
+    if _ACTIVITY_RE.search(path):
+        return PATH_ACTIVITY
+    return PATH_OTHER
@@ -1,12 +1,45 @@
 """SMS/WhatsApp sender using Twilio API."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..utils.debounce import Coalescer
 
 logger = logging.getLogger(__name__)
 
 # Twilio WhatsApp sandbox number
 WHATSAPP_SANDBOX_NUMBER = "+14155238886"
 
+# Longest message body Twilio accepts
+MAX_TEXT_LEN = 1600
+
+# Notifications arriving this soon after the first of a burst share one message
+COALESCE_SECONDS = 0.3
+
+# Twilio requests allowed in flight at once while a burst of notifications drains
+SEND_WORKERS = 4
+
+# Twilio clients keyed by (account_sid, auth_token), shared between senders
+_CLIENT_CACHE: Dict[Tuple[str, str], Any] = {}
+
+
+def _get_client(account_sid: str, auth_token: str) -> Any:
+    """
+    Return a Twilio client for the credentials, creating it on first use.
+
+    Reusing one client keeps its requests session, and with it the open
+    HTTPS connections, so later messages skip the TCP/TLS handshake.
+    """
+    key = (account_sid, auth_token)
+    client = _CLIENT_CACHE.get(key)
+    if client is None:
+        from twilio.rest import Client
+
+        client = _CLIENT_CACHE[key] = Client(account_sid, auth_token)
+    return client
+
 
 class TwilioSender:
     """
@@ -42,6 +75,12 @@ class TwilioSender:
         self.enabled = enabled
         self.use_whatsapp = use_whatsapp
         self._client = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = Lock()  # Orders pool creation against close()
+        self._closed = False
+        self._coalescer: Coalescer[Tuple[str, str]] = Coalescer(
+            COALESCE_SECONDS, self._send_batch
+        )
 
         if self.enabled and self._has_credentials():
             self._init_client()
@@ -58,15 +97,13 @@ class TwilioSender:
     def _init_client(self) -> None:
         """Initialize the Twilio client."""
         try:
-            from twilio.rest import Client
-
-            self._client = Client(self.account_sid, self.auth_token)
+            self._client = _get_client(self.account_sid, self.auth_token)
             logger.info("Twilio SMS client initialized")
         except ImportError:
             logger.error("twilio package not installed. Run: pip install twilio")
             self.enabled = False
         except Exception as e:
-            logger.error(f"Failed to initialize Twilio client: {e}")
+            logger.error("Failed to initialize Twilio client: %s", e)
             self.enabled = False
 
     def send(self, text: str) -> bool:
@@ -80,7 +117,7 @@ class TwilioSender:
             True if sent successfully, False otherwise.
         """
         if not self.enabled:
-            logger.debug(f"Messaging disabled, would send: {text}")
+            logger.debug("Messaging disabled, would send: %s", text)
             return False
 
         if not self._client:
@@ -88,9 +125,8 @@ class TwilioSender:
             return False
 
         # Truncate message
-        max_len = 1600
-        if len(text) > max_len:
-            text = text[: max_len - 3] + "..."
+        if len(text) > MAX_TEXT_LEN:
+            text = text[: MAX_TEXT_LEN - 3] + "..."
 
         try:
             if self.use_whatsapp:
@@ -109,30 +145,63 @@ class TwilioSender:
                 from_=from_addr,
                 to=to_addr,
             )
-            logger.debug(f"{msg_type} sent: {message.sid}")
+            logger.debug("%s sent: %s", msg_type, message.sid)
             return True
         except Exception as e:
-            logger.error(f"Failed to send {msg_type}: {e}")
+            logger.error("Failed to send %s: %s", msg_type, e)
             return False
 
     def send_notification(self, sender: str, message: str) -> bool:
         """
-        Send a notification as SMS.
+        Send a notification as SMS without waiting for Twilio.
+
+        Notifications arriving within COALESCE_SECONDS of each other are
+        combined into one message, which is then sent on a small worker pool
+        so the caller never waits on a Twilio round trip.
 
         Args:
             sender: Message sender name.
             message: Message content.
 
         Returns:
-            True if sent successfully, False otherwise.
+            True if the message was queued for sending, False otherwise.
         """
-        # Truncate message for SMS
+        if self._closed:
+            logger.debug("Sender closed, dropping notification from %s", sender)
+            return False
+
+        if not self.enabled or not self._client:
+            return self.send(self._format_line("Slack from ", sender, message))
+
+        self._coalescer.add((sender, message))
+        return True
+
+    @staticmethod
+    def _format_line(prefix: str, sender: str, message: str) -> str:
+        """Format one notification, truncating the message for SMS."""
         max_message_len = 140
         if len(message) > max_message_len:
             message = message[:max_message_len] + "..."
-
-        text = f"Slack from {sender}: {message}"
-        return self.send(text)
+        return f"{prefix}{sender}: {message}"
+
+    def _send_batch(self, batch: List[Tuple[str, str]]) -> None:
+        """Send a burst of notifications as one message on the worker pool."""
+        if len(batch) == 1:
+            text = self._format_line("Slack from ", *batch[0])
+        else:
+            lines = [f"Slack: {len(batch)} new messages"]
+            lines.extend(self._format_line("", sender, message) for sender, message in batch)
+            text = "\n".join(lines)
+
+        with self._executor_lock:
+            if self._closed:
+                return
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=SEND_WORKERS, thread_name_prefix="twilio"
+                )
+            # send() applies the MAX_TEXT_LEN cap; sender titles are unbounded
+            self._executor.submit(self.send, text)
 
     def send_test(self) -> bool:
         """
@@ -142,3 +211,12 @@ class TwilioSender:
             True if sent successfully, False otherwise.
         """
         return self.send("SlackPulse test message - SMS notifications are working!")
+
+    def close(self) -> None:
+        """Stop accepting notifications; ones already submitted are still sent."""
+        self._closed = True
+        self._coalescer.cancel()
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
@@ -1,33 +1,98 @@
 """Text-to-speech using OpenAI API or macOS built-in `say` command."""
 
+import atexit
+import functools
+import hashlib
 import os
+import shutil
 import subprocess
 import tempfile
+import threading
+import time
 import logging
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from pathlib import Path
 
-from dotenv import load_dotenv, set_key
+from ..utils.debounce import Coalescer
 
 logger = logging.getLogger(__name__)
 
-# Load environment variables from .env file
-load_dotenv()
-
 # OpenAI TTS voices
-OPENAI_VOICES = ["alloy", "echo", "fable", "onyx", "nova", "shimmer"]
+OPENAI_VOICES = frozenset({"alloy", "echo", "fable", "onyx", "nova", "shimmer"})
+
+# Players are started by absolute path with close_fds=False so subprocess can
+# use posix_spawn instead of fork+exec. Descriptors Python opens are
+# non-inheritable by default, so nothing leaks into the child.
+SAY = "/usr/bin/say"
+AFPLAY = "/usr/bin/afplay"
+_SPAWN_KWARGS = {
+    "stdout": subprocess.DEVNULL,
+    "stderr": subprocess.DEVNULL,
+    "close_fds": False,
+}
+
+# ffplay can play MP3 from stdin, letting playback start while audio streams in;
+# afplay needs a complete file
+FFPLAY = shutil.which("ffplay")
+
+# Bytes read from the TTS response per write to the player
+STREAM_CHUNK_SIZE = 4096
+
+# How long stop() waits for a terminated player before killing it
+STOP_GRACE_SECONDS = 0.05
+
+# Notifications arriving this soon after the first of a burst are spoken together
+COALESCE_SECONDS = 0.3
+
+# OpenAI "pcm" output: 24 kHz mono signed 16-bit little-endian
+PCM_SAMPLE_RATE = 24000
+
+# .env entry recording when OPENAI_API_KEY last passed validation, as
+# "<unix time>:<key fingerprint>", and how long that result is trusted
+VALIDATED_AT_VAR = "OPENAI_API_KEY_VALIDATED_AT"
+KEY_VALIDATION_TTL = 24 * 60 * 60
+
+# Parsed `say -v '?'` output, reused for a day
+VOICES_CACHE = Path.home() / ".cache" / "slackpulse" / "voices.txt"
+VOICES_CACHE_TTL = 24 * 60 * 60
 
 # Path to .env file (in project root)
 ENV_FILE = Path(__file__).parent.parent.parent / ".env"
 
 
+# OPENAI_API_KEY as first read from the environment, or as last saved
+_api_key: Optional[str] = None
+
+
+@functools.lru_cache(maxsize=1)
 def _get_env_file_path() -> Path:
-    """Get the path to the .env file."""
-    # Try project root first
-    if ENV_FILE.exists():
-        return ENV_FILE
-    # Create if doesn't exist
-    return ENV_FILE
+    """Get the path to the .env file (in the project root, created on demand)."""
+    return ENV_FILE.resolve()
+
+
+def _get_api_key() -> Optional[str]:
+    """Return OPENAI_API_KEY, loading .env on first use."""
+    global _api_key
+    if _api_key is None:
+        _load_env()
+        _api_key = os.getenv("OPENAI_API_KEY") or None
+    return _api_key
+
+
+@functools.lru_cache(maxsize=1)
+def _load_env() -> None:
+    """Load environment variables from the .env file, once."""
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+
+@functools.lru_cache(maxsize=1)
+def _openai_class():
+    """Import openai on first use; it is slow to import and only needed for OpenAI TTS."""
+    from openai import OpenAI
+
+    return OpenAI
 
 
 def _prompt_for_api_key() -> Optional[str]:
@@ -48,21 +113,58 @@ def _prompt_for_api_key() -> Optional[str]:
     return None
 
 
-def _validate_api_key(api_key: str) -> bool:
-    """Validate an OpenAI API key by making a test request."""
+def _validate_api_key(api_key: str):
+    """
+    Validate an OpenAI API key by making a test request.
+
+    Returns:
+        The OpenAI client that made the request, or None if the key was rejected.
+    """
+    OpenAI = _openai_class()  # ImportError is reported by the caller
     try:
-        from openai import OpenAI
         client = OpenAI(api_key=api_key)
         # Make a minimal API call to validate
         client.models.list()
-        return True
+        return client
     except Exception as e:
-        logger.debug(f"API key validation failed: {e}")
+        logger.debug("API key validation failed: %s", e)
+        return None
+
+
+def _key_fingerprint(api_key: str) -> str:
+    """Short digest identifying a key without storing it twice."""
+    return hashlib.sha256(api_key.encode()).hexdigest()[:16]
+
+
+def _recently_validated(api_key: str) -> bool:
+    """Check whether this key passed validation within KEY_VALIDATION_TTL."""
+    stamp = os.getenv(VALIDATED_AT_VAR, "")
+    validated_at, _, fingerprint = stamp.partition(":")
+    try:
+        age = time.time() - float(validated_at)
+    except ValueError:
         return False
+    return 0 <= age < KEY_VALIDATION_TTL and fingerprint == _key_fingerprint(api_key)
+
+
+def _record_validation(api_key: str) -> None:
+    """Remember in .env that this key just passed validation."""
+    stamp = f"{int(time.time())}:{_key_fingerprint(api_key)}"
+    os.environ[VALIDATED_AT_VAR] = stamp
+    env_path = _get_env_file_path()
+    if not env_path.exists():
+        return
+    try:
+        from dotenv import set_key
+
+        set_key(str(env_path), VALIDATED_AT_VAR, stamp)
+    except Exception as e:
+        logger.debug("Could not record API key validation: %s", e)
 
 
 def _save_api_key(api_key: str) -> bool:
     """Save the API key to .env file."""
+    global _api_key
     try:
         env_path = _get_env_file_path()
 
@@ -71,18 +173,83 @@ def _save_api_key(api_key: str) -> bool:
             env_path.write_text("# SlackPulse Environment Variables\n# DO NOT commit this file to git\n\n")
 
         # Save using dotenv
+        from dotenv import set_key
+
         set_key(str(env_path), "OPENAI_API_KEY", api_key)
 
         # Also set in current environment
-        os.environ["OPENAI_API_KEY"] = api_key
+        os.environ["OPENAI_API_KEY"] = _api_key = api_key
 
         print(f"API key saved to {env_path}")
         return True
     except Exception as e:
-        logger.error(f"Failed to save API key: {e}")
+        logger.error("Failed to save API key: %s", e)
         return False
 
 
+def _macos_voice_names() -> List[str]:
+    """
+    Return the names of the installed macOS voices.
+
+    Parsing `say -v '?'` takes a subprocess, so the result is cached on disk
+    for VOICES_CACHE_TTL seconds.
+    """
+    try:
+        if time.time() - VOICES_CACHE.stat().st_mtime < VOICES_CACHE_TTL:
+            return VOICES_CACHE.read_text().splitlines()
+    except OSError:
+        pass  # No usable cache yet
+
+    result = subprocess.run(
+        [SAY, "-v", "?"],
+        capture_output=True,
+        text=True,
+        timeout=5,
+        check=True,
+    )
+    names = [
+        line.partition(" ")[0]
+        for line in result.stdout.splitlines()
+        if line and not line.startswith(" ")
+    ]
+
+    try:
+        VOICES_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        VOICES_CACHE.write_text("\n".join(names))
+    except OSError as e:
+        logger.debug("Could not cache voice list: %s", e)
+    return names
+
+
+def _pcm_output_available() -> bool:
+    """Check that sounddevice is installed and an output device exists."""
+    try:
+        import sounddevice
+    except ImportError:
+        return False
+
+    try:
+        sounddevice.query_devices(kind="output")
+        return True
+    except Exception as e:
+        logger.warning("Audio output unavailable (%s), using a player process", e)
+        return False
+
+
+def _open_pcm_stream():
+    """Open and start a raw PCM output stream for one OpenAI TTS utterance."""
+    import sounddevice
+
+    stream = sounddevice.RawOutputStream(
+        samplerate=PCM_SAMPLE_RATE,
+        channels=1,
+        dtype="int16",
+        blocksize=2048,
+    )
+    stream.start()
+    return stream
+
+
 class Speaker:
     """
     Text-to-speech wrapper.
@@ -116,67 +283,83 @@ class Speaker:
         self.prompt_for_key = prompt_for_key
         self._process: Optional[subprocess.Popen] = None
         self._openai_client = None
+        self._use_pcm = False  # Play OpenAI PCM through sounddevice
+        self._pcm_thread: Optional[threading.Thread] = None
+        self._utterance = 0  # Bumped by stop() to cancel in-flight PCM streaming
+        # Held while one utterance replaces another, so an older one is always
+        # stopped before a newer one writes the temp file or spawns a player
+        self._speak_lock = threading.Lock()
+        # Audio file for the afplay fallback, overwritten by each utterance
+        self._tts_path = (
+            Path(tempfile.gettempdir()) / f"slackpulse_tts_{os.getpid()}_{id(self):x}.mp3"
+        )
+        self._tts_path_registered = False
+        self._coalescer: Coalescer[Tuple[str, str]] = Coalescer(
+            COALESCE_SECONDS, self._speak_batch
+        )
+
+        # Resolve the voice for each backend once instead of on every speak
+        self._openai_voice = voice if voice in OPENAI_VOICES else "nova"
+        self._macos_voice = voice if voice not in OPENAI_VOICES else "Samantha"
+        self._macos_argv_prefix = (SAY, "-v", self._macos_voice, "-r", str(rate))
 
         if self.use_openai:
             self._init_openai()
+        if self.use_openai and self.enabled:
+            self._use_pcm = _pcm_output_available()
 
     def _init_openai(self) -> None:
         """Initialize OpenAI client, prompting for key if needed."""
-        api_key = os.getenv("OPENAI_API_KEY")
-
-        # If no key, prompt for one
-        if not api_key and self.prompt_for_key:
-            api_key = _prompt_for_api_key()
-            if api_key:
-                if _validate_api_key(api_key):
-                    _save_api_key(api_key)
-                    print("API key validated and saved successfully!")
-                else:
-                    print("Invalid API key. Falling back to macOS TTS.")
-                    api_key = None
-
-        if not api_key:
-            if self.prompt_for_key:
-                print("No API key provided. Using macOS TTS (robotic voice).")
-            else:
-                logger.warning("OPENAI_API_KEY not set, falling back to macOS TTS")
-            self.use_openai = False
-            return
+        api_key = _get_api_key()
 
         try:
-            from openai import OpenAI
-            self._openai_client = OpenAI(api_key=api_key)
-
-            # Validate the key works
-            try:
-                self._openai_client.models.list()
-                logger.info("OpenAI TTS initialized")
-            except Exception as e:
+            if not api_key:
+                # If no key, prompt for one
                 if self.prompt_for_key:
-                    print(f"API key invalid: {e}")
-                    # Prompt for new key
-                    new_key = _prompt_for_api_key()
-                    if new_key and _validate_api_key(new_key):
-                        _save_api_key(new_key)
-                        self._openai_client = OpenAI(api_key=new_key)
-                        print("API key validated and saved successfully!")
-                        logger.info("OpenAI TTS initialized")
-                    else:
-                        print("Using macOS TTS instead.")
-                        self.use_openai = False
-                        self._openai_client = None
+                    self._openai_client = self._prompt_for_valid_key()
                 else:
-                    logger.error(f"OpenAI API key invalid: {e}")
-                    self.use_openai = False
-                    self._openai_client = None
+                    logger.warning("OPENAI_API_KEY not set, falling back to macOS TTS")
+            elif _recently_validated(api_key):
+                # Validated within the TTL; skip the network probe
+                self._openai_client = _openai_class()(api_key=api_key)
+            else:
+                self._openai_client = _validate_api_key(api_key)
+                if self._openai_client is not None:
+                    _record_validation(api_key)
+                elif self.prompt_for_key:
+                    print("API key invalid.")
+                    self._openai_client = self._prompt_for_valid_key()
+                else:
+                    logger.error("OpenAI API key invalid")
 
         except ImportError:
             logger.error("openai package not installed. Run: pip install openai")
-            self.use_openai = False
         except Exception as e:
-            logger.error(f"Failed to initialize OpenAI: {e}")
+            logger.error("Failed to initialize OpenAI: %s", e)
+            self._openai_client = None
+
+        if self._openai_client is not None:
+            logger.info("OpenAI TTS initialized")
+        else:
             self.use_openai = False
 
+    def _prompt_for_valid_key(self):
+        """Ask for a key, validate and save it; returns the client or None."""
+        api_key = _prompt_for_api_key()
+        if not api_key:
+            print("No API key provided. Using macOS TTS (robotic voice).")
+            return None
+
+        client = _validate_api_key(api_key)
+        if client is None:
+            print("Invalid API key. Falling back to macOS TTS.")
+            return None
+
+        _save_api_key(api_key)
+        _record_validation(api_key)
+        print("API key validated and saved successfully!")
+        return client
+
     def speak(self, text: str) -> None:
         """
         Speak the given text.
@@ -186,138 +369,238 @@ class Speaker:
         Args:
             text: Text to speak.
         """
+        self._speak_sanitized(self._sanitize_text(text))
+
+    def _speak_sanitized(self, text: str) -> None:
+        """Speak text that has already been through _sanitize_text."""
         if not self.enabled:
-            logger.debug(f"TTS disabled, would say: {text}")
+            logger.debug("TTS disabled, would say: %s", text)
             return
 
-        # Stop any current speech
-        self.stop()
+        with self._speak_lock:
+            # Stop any current speech
+            self.stop()
 
-        # Sanitize text
-        text = self._sanitize_text(text)
-
-        if self.use_openai and self._openai_client:
-            self._speak_openai(text)
-        else:
-            self._speak_macos(text)
+            if self.use_openai and self._openai_client:
+                self._speak_openai(text)
+            else:
+                self._speak_macos(text)
 
     def _speak_openai(self, text: str) -> None:
         """Speak using OpenAI TTS API."""
+        if self._use_pcm:
+            self._stream_openai_pcm(text)
+        elif FFPLAY:
+            self._stream_openai(text)
+        else:
+            self._play_openai_file(text)
+
+    def _stream_openai_pcm(self, text: str) -> None:
+        """Play raw PCM from OpenAI TTS through sounddevice as it arrives."""
+        self._pcm_thread = threading.Thread(
+            target=self._pump_openai_pcm, args=(self._utterance, text), daemon=True
+        )
+        self._pcm_thread.start()
+        logger.debug("Speaking (OpenAI, PCM): %.50s...", text)
+
+    def _pump_openai_pcm(self, utterance: int, text: str) -> None:
+        """
+        Write streamed PCM chunks to an output stream until done or stopped.
+
+        The stream is opened for this utterance only and every PortAudio call
+        happens on this thread; stop() just bumps _utterance, which is checked
+        before each write.
+        """
+        stream = None
+        try:
+            with self._openai_client.audio.speech.with_streaming_response.create(
+                model="tts-1",
+                voice=self._openai_voice,
+                input=text,
+                response_format="pcm",
+            ) as response:
+                for chunk in response.iter_bytes(chunk_size=STREAM_CHUNK_SIZE):
+                    if self._utterance != utterance:
+                        break
+                    if stream is None:
+                        stream = _open_pcm_stream()
+                    stream.write(chunk)
+        except Exception as e:
+            with self._speak_lock:
+                if self._utterance == utterance:
+                    logger.error("OpenAI TTS error: %s, falling back to macOS", e)
+                    self._speak_macos(text)
+        finally:
+            if stream is not None:
+                try:
+                    if self._utterance == utterance:
+                        stream.stop()  # Plays out what is buffered
+                    else:
+                        stream.abort()  # Superseded: drop buffered audio
+                    stream.close()
+                except Exception as e:
+                    logger.debug("Failed to close audio stream: %s", e)
+
+    def _stream_openai(self, text: str) -> None:
+        """Pipe OpenAI TTS audio into ffplay as it is generated."""
+        try:
+            process = subprocess.Popen(
+                [FFPLAY, "-nodisp", "-autoexit", "-loglevel", "quiet", "-"],
+                stdin=subprocess.PIPE,
+                **_SPAWN_KWARGS,
+            )
+        except Exception as e:
+            logger.error("ffplay failed to start: %s, falling back to afplay", e)
+            self._play_openai_file(text)
+            return
+
+        self._process = process
+        threading.Thread(
+            target=self._pump_openai_audio, args=(process, text), daemon=True
+        ).start()
+        logger.debug("Speaking (OpenAI, streaming): %.50s...", text)
+
+    def _pump_openai_audio(self, process: subprocess.Popen, text: str) -> None:
+        """Copy the streamed TTS response into the player's stdin."""
+        try:
+            with self._openai_client.audio.speech.with_streaming_response.create(
+                model="tts-1",
+                voice=self._openai_voice,
+                input=text,
+                response_format="mp3",
+            ) as response:
+                for chunk in response.iter_bytes(chunk_size=STREAM_CHUNK_SIZE):
+                    process.stdin.write(chunk)
+        except (BrokenPipeError, ValueError):
+            # Player was stopped mid-stream
+            return
+        except Exception as e:
+            logger.error("OpenAI TTS error: %s, falling back to macOS", e)
+            # Only fall back if this speech hasn't been superseded
+            with self._speak_lock:
+                if self._process is process:
+                    process.kill()
+                    self._speak_macos(text)
+        finally:
+            try:
+                process.stdin.close()
+            except (BrokenPipeError, OSError):
+                pass
+
+    def _play_openai_file(self, text: str) -> None:
+        """Synthesize with OpenAI TTS into a temp file and play it with afplay."""
         try:
             # Generate speech
             response = self._openai_client.audio.speech.create(
                 model="tts-1",
-                voice=self.voice if self.voice in OPENAI_VOICES else "nova",
+                voice=self._openai_voice,
                 input=text,
             )
 
-            # Save to temp file and play
-            with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as f:
-                temp_path = f.name
-                response.stream_to_file(temp_path)
+            # Overwrite this speaker's audio file and play it
+            if not self._tts_path_registered:
+                atexit.register(self._tts_path.unlink, missing_ok=True)
+                self._tts_path_registered = True
+            response.stream_to_file(self._tts_path)
 
             # Play audio asynchronously
             self._process = subprocess.Popen(
-                ["afplay", temp_path],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
+                [AFPLAY, str(self._tts_path)],
+                **_SPAWN_KWARGS,
             )
-            logger.debug(f"Speaking (OpenAI): {text[:50]}...")
-
-            # Clean up temp file after playback (in background)
-            def cleanup():
-                if self._process:
-                    self._process.wait()
-                try:
-                    os.unlink(temp_path)
-                except:
-                    pass
-
-            import threading
-            threading.Thread(target=cleanup, daemon=True).start()
+            logger.debug("Speaking (OpenAI): %.50s...", text)
 
         except Exception as e:
-            logger.error(f"OpenAI TTS error: {e}, falling back to macOS")
+            logger.error("OpenAI TTS error: %s, falling back to macOS", e)
             self._speak_macos(text)
 
     def _speak_macos(self, text: str) -> None:
         """Speak using macOS say command (fallback)."""
-        cmd = [
-            "say",
-            "-v", self.voice if self.voice not in OPENAI_VOICES else "Samantha",
-            "-r", str(self.rate),
-            text,
-        ]
-
         try:
             self._process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
+                (*self._macos_argv_prefix, text),
+                **_SPAWN_KWARGS,
             )
-            logger.debug(f"Speaking (macOS): {text[:50]}...")
+            logger.debug("Speaking (macOS): %.50s...", text)
 
         except FileNotFoundError:
             logger.error("'say' command not found - TTS unavailable")
         except Exception as e:
-            logger.error(f"TTS error: {e}")
+            logger.error("TTS error: %s", e)
 
     def speak_notification(self, sender: str, message: str) -> None:
         """
         Speak a notification in natural format.
 
+        Notifications arriving within COALESCE_SECONDS of each other are
+        announced together, so a burst costs one synthesis instead of one
+        per message.
+
         Args:
             sender: Message sender name.
             message: Message content.
         """
-        # Truncate long messages
+        self._coalescer.add((sender, message))
+
+    def _speak_batch(self, batch: List[Tuple[str, str]]) -> None:
+        """Announce a burst of notifications as a single utterance."""
+        sender, message = batch[-1]
+
+        # Sanitize before truncating so the cap counts spoken characters
+        message = self._sanitize_text(message)
         max_message_len = 200
         if len(message) > max_message_len:
             message = message[:max_message_len] + "..."
+        sender = self._sanitize_text(sender)
 
-        text = f"Message from {sender}: {message}"
-        self.speak(text)
+        if len(batch) == 1:
+            self._speak_sanitized(f"Message from {sender}: {message}")
+        else:
+            self._speak_sanitized(
+                f"{len(batch)} new messages. Latest from {sender}: {message}"
+            )
 
     def stop(self) -> None:
         """Stop any current speech."""
-        if self._process and self._process.poll() is None:
-            self._process.terminate()
-            try:
-                self._process.wait(timeout=1)
-            except subprocess.TimeoutExpired:
-                self._process.kill()
-            self._process = None
+        # The PCM pump aborts its own stream once it sees the new token
+        self._utterance += 1
+        self._pcm_thread = None
+
+        process, self._process = self._process, None
+        if process is not None and process.poll() is None:
+            # Give the player a moment to exit cleanly, but never block the caller
+            process.terminate()
+            deadline = time.monotonic() + STOP_GRACE_SECONDS
+            while process.poll() is None and time.monotonic() < deadline:
+                time.sleep(0.005)
+            if process.poll() is None:
+                process.kill()
 
     def is_speaking(self) -> bool:
         """Check if currently speaking."""
+        if self._pcm_thread is not None and self._pcm_thread.is_alive():
+            return True
         return self._process is not None and self._process.poll() is None
 
+    def close(self) -> None:
+        """Stop speaking and release the temp file."""
+        self._coalescer.cancel()
+        self.stop()
+        self._tts_path.unlink(missing_ok=True)
+
     def _sanitize_text(self, text: str) -> str:
         """Sanitize text for TTS."""
-        text = text.replace("\n", " ")
-        text = text.replace("\r", " ")
-        text = text.replace("\t", " ")
-        while "  " in text:
-            text = text.replace("  ", " ")
-        return text.strip()
+        # Collapse every whitespace run (newlines, tabs, repeated spaces) to one space
+        return " ".join(text.split())
 
     @staticmethod
     def list_voices() -> List[str]:
         """List available voices."""
-        voices = ["OpenAI voices: " + ", ".join(OPENAI_VOICES)]
+        voices = ["OpenAI voices: " + ", ".join(sorted(OPENAI_VOICES))]
         try:
-            result = subprocess.run(
-                ["say", "-v", "?"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
+            names = _macos_voice_names()
             voices.append("macOS voices:")
-            for line in result.stdout.strip().split("\n"):
-                if line:
-                    parts = line.split()
-                    if parts:
-                        voices.append(f"  {parts[0]}")
+            voices.extend(f"  {name}" for name in names)
         except Exception as e:
-            logger.error(f"Failed to list macOS voices: {e}")
+            logger.error("Failed to list macOS voices: %s", e)
         return voices
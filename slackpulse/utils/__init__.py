@@ -1,6 +1,20 @@
 """Utility modules for SlackPulse."""
 
-from .logging import setup_logging
-from .signals import install_signal_handlers
+from typing import Any
 
 __all__ = ["setup_logging", "install_signal_handlers"]
+
+# Submodules providing the re-exported names. They are imported on first
+# access so light modules such as utils.compat don't pull in logging.handlers.
+_EXPORTS = {
+    "setup_logging": ".logging",
+    "install_signal_handlers": ".signals",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _EXPORTS:
+        from importlib import import_module
+
+        return getattr(import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,65 @@
+"""Batching of items that arrive in quick succession."""
+
+import logging
+import threading
+from typing import Callable, Generic, List, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class Coalescer(Generic[T]):
+    """
+    Collect items and deliver each burst to a callback as one batch.
+
+    The first item of a burst arms a timer; everything added before it
+    fires is flushed together, so delivery is delayed by at most `delay`.
+    Flushes run one at a time: a burst that fires while the previous flush
+    is still running waits for it.
+    """
+
+    def __init__(self, delay: float, flush: Callable[[List[T]], None]):
+        """
+        Initialize the coalescer.
+
+        Args:
+            delay: Seconds to wait after the first item of a burst.
+            flush: Called on the timer thread with the items of the burst.
+        """
+        self._delay = delay
+        self._flush = flush
+        self._pending: List[T] = []
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()  # Serializes flush callbacks
+
+    def add(self, item: T) -> None:
+        """Queue an item, arming the flush timer if none is pending."""
+        with self._lock:
+            self._pending.append(item)
+            if self._timer is None:
+                self._timer = threading.Timer(self._delay, self._fire)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _fire(self) -> None:
+        """Hand the pending items to the flush callback."""
+        with self._flush_lock:
+            with self._lock:
+                items, self._pending = self._pending, []
+                self._timer = None
+            if not items:
+                return  # Cancelled while waiting for the previous flush
+            try:
+                self._flush(items)
+            except Exception as e:
+                logger.error(f"Error flushing batch: {e}")
+
+    def cancel(self) -> None:
+        """Drop pending items and disarm the timer."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._pending = []
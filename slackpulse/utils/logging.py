@@ -1,10 +1,24 @@
 """Logging configuration."""
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
 from typing import Optional
 
+# Writes queued records to the real handlers on a background thread
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_listener() -> None:
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
 
 def setup_logging(
     verbose: bool = False,
@@ -13,6 +27,9 @@ def setup_logging(
     """
     Configure logging for the application.
 
+    Log calls only enqueue the record; console and file output happen on a
+    QueueListener thread, so callers never block on I/O.
+
     Args:
         verbose: Enable DEBUG level logging.
         log_file: Optional file path for logging.
@@ -39,13 +56,31 @@ def setup_logging(
         file_handler.setFormatter(logging.Formatter(fmt, datefmt))
         handlers.append(file_handler)
 
+    # Route records through a queue to the handlers above
+    global _listener
+    _stop_listener()
+    # SimpleQueue.put is reentrant, so the shutdown signal handler can log
+    # even if it interrupts the main thread mid-put
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _listener.start()
+
+    # The queue carries the bare message; the handlers apply the real format
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
     # Configure root logger
     logging.basicConfig(
         level=level,
-        handlers=handlers,
+        handlers=[queue_handler],
         force=True,
     )
 
     # Quiet noisy loggers
     logging.getLogger("urllib3").setLevel(logging.WARNING)
     logging.getLogger("watchdog").setLevel(logging.WARNING)
+
+
+atexit.register(_stop_listener)
@@ -16,9 +16,11 @@ def install_signal_handlers() -> Event:
     """
     shutdown_event = Event()
 
+    # Resolved up front so the handler only does a dict lookup
+    sig_names = {signal.SIGINT: "SIGINT", signal.SIGTERM: "SIGTERM"}
+
     def handler(signum, frame):
-        sig_name = signal.Signals(signum).name
-        logger.info(f"Received {sig_name}, initiating shutdown...")
+        logger.info("Received %s, initiating shutdown...", sig_names.get(signum, signum))
         shutdown_event.set()
 
     signal.signal(signal.SIGINT, handler)
@@ -0,0 +1,45 @@
+"""Tests for bot message detection."""
+
+import pytest
+
+from slackpulse.filters import BotFilter
+
+
+def test_default_patterns_match_bot_senders():
+    bot_filter = BotFilter()
+    assert bot_filter.is_bot_message("Deploy Bot", "hello")
+    assert bot_filter.is_bot_message("Alice", "Bob has joined the channel")
+    assert not bot_filter.is_bot_message("Alice", "hello")
+
+
+def test_backreferences_stay_scoped_to_their_pattern():
+    bot_filter = BotFilter([r"(a)\1", r"x(b)\1"])
+    assert bot_filter.is_bot_message("aa", "")
+    assert bot_filter.is_bot_message("xbb", "")
+    assert not bot_filter.is_bot_message("xba", "")
+
+
+def test_repeated_group_names_are_allowed():
+    bot_filter = BotFilter([r"(?P<n>a)", r"(?P<n>b)"])
+    assert bot_filter.is_bot_message("a", "")
+    assert bot_filter.is_bot_message("b", "")
+    assert not bot_filter.is_bot_message("c", "")
+
+
+def test_leading_inline_flags_apply_to_their_own_pattern():
+    bot_filter = BotFilter([r"(?x) bot # trailing comment", r"(?i)helper"])
+    assert bot_filter.is_bot_message("BOT", "")
+    assert bot_filter.is_bot_message("Helper", "")
+    assert not bot_filter.is_bot_message("b o t", "")
+
+
+def test_invalid_pattern_raises_value_error():
+    with pytest.raises(ValueError, match="Invalid bot pattern"):
+        BotFilter([r"bot", r"(unclosed"])
+
+
+def test_invalid_added_pattern_keeps_existing_patterns():
+    bot_filter = BotFilter([r"bot"])
+    with pytest.raises(ValueError):
+        bot_filter.add_bot_pattern(r"(unclosed")
+    assert bot_filter.is_bot_message("bot", "")